@@ -1,79 +1,89 @@
+from collections.abc import Iterator
 from typing import Any
 
 from dagster import (
     AssetExecutionContext,
     AssetIn,
     AssetKey,
+    AssetOut,
     FreshnessPolicy,
     MetadataValue,
+    Output,
     asset,
+    multi_asset,
 )
 
 from .resources import GitHubAPIResource
 from .utils import create_markdown_report, extract_metadata
 
-
-@asset(
-    name='delta-rs_repo_metadata',
-    key_prefix=['stage', 'github', 'repositories', 'delta-io', 'delta-rs'],
-    io_manager_key='json_io_manager',
-    group_name='github',
-    freshness_policy=FreshnessPolicy(maximum_lag_minutes=60 * 24),  # 24 hours
-)
-def delta_rs_metadata(context: AssetExecutionContext, github_api: GitHubAPIResource) -> dict[str, Any]:
-    """Metadata from the GitHub repository of the Delta Lake Python client."""
-    repo_metadata = github_api.get_metadata(owner='delta-io', repo='delta-rs')
-
-    context.add_output_metadata(
-        metadata={
-            'repo link': MetadataValue.url(repo_metadata.get('html_url')),
-            'data preview': MetadataValue.json(repo_metadata),
-        }
-    )
-
-    return repo_metadata
-
-
-@asset(
-    name='iceberg-python_repo_metadata',
-    key_prefix=['stage', 'github', 'repositories', 'apache', 'iceberg-python'],
-    io_manager_key='json_io_manager',
-    group_name='github',
-    freshness_policy=FreshnessPolicy(maximum_lag_minutes=60 * 24),  # 24 hours
-)
-def iceberg_python_metadata(context: AssetExecutionContext, github_api: GitHubAPIResource) -> dict[str, Any]:
-    """Metadata from the GitHub repository of the Iceberg Python client."""
-    repo_metadata = github_api.get_metadata(owner='apache', repo='iceberg-python')
-
-    context.add_output_metadata(
-        metadata={
-            'repo link': MetadataValue.url(repo_metadata.get('html_url')),
-            'data preview': MetadataValue.json(repo_metadata),
-        }
-    )
-
-    return repo_metadata
-
-
-@asset(
-    name='hudi-rs_repo_metadata',
-    key_prefix=['stage', 'github', 'repositories', 'apache', 'hudi-rs'],
-    io_manager_key='json_io_manager',
+REPOSITORIES = {
+    'delta_rs': ('delta-io', 'delta-rs'),
+    'iceberg_python': ('apache', 'iceberg-python'),
+    'hudi_rs': ('apache', 'hudi-rs'),
+}
+"""Owner and name of the GitHub repositories by output name of the `repo_metadata` assets."""
+
+
+@multi_asset(
+    outs={
+        'delta_rs': AssetOut(
+            key=AssetKey(['stage', 'github', 'repositories', 'delta-io', 'delta-rs', 'delta-rs_repo_metadata']),
+            io_manager_key='json_io_manager',
+            is_required=False,
+            freshness_policy=FreshnessPolicy(maximum_lag_minutes=60 * 24),  # 24 hours
+            description='Metadata from the GitHub repository of the Delta Lake Python client.',
+        ),
+        'iceberg_python': AssetOut(
+            key=AssetKey(
+                ['stage', 'github', 'repositories', 'apache', 'iceberg-python', 'iceberg-python_repo_metadata']
+            ),
+            io_manager_key='json_io_manager',
+            is_required=False,
+            freshness_policy=FreshnessPolicy(maximum_lag_minutes=60 * 24),  # 24 hours
+            description='Metadata from the GitHub repository of the Iceberg Python client.',
+        ),
+        'hudi_rs': AssetOut(
+            key=AssetKey(['stage', 'github', 'repositories', 'apache', 'hudi-rs', 'hudi-rs_repo_metadata']),
+            io_manager_key='json_io_manager',
+            is_required=False,
+            freshness_policy=FreshnessPolicy(maximum_lag_minutes=60 * 24),  # 24 hours
+            description='Metadata from the GitHub repository of the Hudi Python client.',
+        ),
+    },
     group_name='github',
-    freshness_policy=FreshnessPolicy(maximum_lag_minutes=60 * 24),  # 24 hours
+    can_subset=True,
 )
-def hudi_rs_metadata(context: AssetExecutionContext, github_api: GitHubAPIResource) -> dict[str, Any]:
-    """Metadata from the GitHub repository of the Hudi Python client."""
-    repo_metadata = github_api.get_metadata(owner='apache', repo='hudi-rs')
-
-    context.add_output_metadata(
-        metadata={
-            'repo link': MetadataValue.url(repo_metadata.get('html_url')),
-            'data preview': MetadataValue.json(repo_metadata),
-        }
+def repo_metadata(context: AssetExecutionContext, github_api: GitHubAPIResource) -> Iterator[Output[dict[str, Any]]]:
+    """Metadata from the GitHub repositories of the lakehouse table format Python clients.
+    The repositories are requested concurrently, but only the selected ones.
+    A failing repository does not keep the others from being materialized,
+    the step fails after the outputs of the successful repositories.
+    """
+    output_names = [name for name in REPOSITORIES if name in context.selected_output_names]
+    repos_metadata = github_api.get_metadata_many(
+        repos=[REPOSITORIES[name] for name in output_names], return_exceptions=True
     )
 
-    return repo_metadata
+    errors = {}
+    for output_name, repo_metadata in zip(output_names, repos_metadata):
+        if isinstance(repo_metadata, BaseException):
+            if not isinstance(repo_metadata, Exception):
+                raise repo_metadata  # e.g. cancellation of the run
+            context.log.error(f'Getting the metadata for {output_name} failed: {repo_metadata!r}')
+            errors[output_name] = repo_metadata
+            continue
+
+        yield Output(
+            value=repo_metadata,
+            output_name=output_name,
+            metadata={
+                'repo link': MetadataValue.url(repo_metadata.get('html_url')),
+                'data preview': MetadataValue.json(repo_metadata),
+            },
+        )
+
+    if errors:
+        raise RuntimeError(f'Getting the metadata failed for {", ".join(errors)}') from next(iter(errors.values()))
 
 
 @asset(
@@ -1,21 +1,214 @@
-from typing import Any, Generator
-from urllib.parse import urljoin
-
-import requests
-from datetime import datetime
+import asyncio
+import copy
+import json
+import os
+import random
 import re
-from typing import Union, Tuple
-from dagster import ConfigurableResource, get_dagster_logger
+import tempfile
+import time
+import weakref
+from collections.abc import AsyncIterator, Mapping, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Tuple
+from urllib.parse import urlencode
+
+import httpx
+import numpy as np
+from dagster import ConfigurableResource, InitResourceContext, get_dagster_logger
+from pydantic import PrivateAttr
+
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:  # orjson is optional, the standard library is used as fallback
+    _json_loads = json.loads
+
+_PER_PAGE = 100
+"""Number of items per page for paginated endpoints (maximum allowed by GitHub)."""
+
+_MAX_ATTEMPTS = 5
+"""Maximum number of attempts for a request, which was rate limited or failed with a server error."""
+
+_RATE_LIMIT_THROTTLE = 0.1
+"""Fraction of the rate limit, below which the remaining requests are spread evenly until the rate limit resets."""
+
+_SECONDARY_RATE_LIMIT_DELAY = 60
+"""Seconds to wait before the first retry, when a secondary rate limit without `Retry-After` is hit."""
+
+_ETAG_CACHE_MAX_AGE = 30 * 24 * 60 * 60
+"""Seconds after the last use, after which an entry of the ETag cache is dropped."""
+
+_ETAG_CACHE_MAX_SIZE = 16 * 1024 * 1024
+"""Maximum total length of the response bodies kept in the ETag cache (in memory and in the cache file)."""
+
+_NEXT_LINK_RE = re.compile(r'<([^>]+)>;\s*rel="next"')
+"""Matches the URL of the next page in the `Link` header of a paginated response."""
+
+_LAST_PAGE_RE = re.compile(r'<[^>]*[?&]page=(\d+)[^>]*>;\s*rel="last"')
+"""Matches the page number of the last page in the `Link` header of a paginated response."""
+
+_REPO_TOTALS_QUERY = """
+query ($owner: String!, $repo: String!) {
+  repository(owner: $owner, name: $repo) {
+    releases {
+      totalCount
+    }
+    openIssues: issues(states: OPEN) {
+      totalCount
+    }
+    closedIssues: issues(states: CLOSED) {
+      totalCount
+    }
+    openPullRequests: pullRequests(states: OPEN) {
+      totalCount
+    }
+    closedPullRequests: pullRequests(states: [CLOSED, MERGED]) {
+      totalCount
+    }
+  }
+}
+"""
+"""GraphQL query for the number of releases, issues and pull requests of a repository."""
+
+_CLOSED_ISSUES_QUERY = """
+query ($owner: String!, $repo: String!, $first: Int!, $after: String) {
+  repository(owner: $owner, name: $repo) {
+    items: issues(states: CLOSED, first: $first, after: $after) {
+      nodes {
+        createdAt
+        closedAt
+      }
+      pageInfo {
+        endCursor
+        hasNextPage
+      }
+    }
+  }
+}
+"""
+"""GraphQL query for the timestamps of one page of closed issues of a repository."""
+
+_CLOSED_PULL_REQUESTS_QUERY = """
+query ($owner: String!, $repo: String!, $first: Int!, $after: String) {
+  repository(owner: $owner, name: $repo) {
+    items: pullRequests(states: [CLOSED, MERGED], first: $first, after: $after) {
+      nodes {
+        createdAt
+        closedAt
+      }
+      pageInfo {
+        endCursor
+        hasNextPage
+      }
+    }
+  }
+}
+"""
+"""GraphQL query for the timestamps of one page of closed (including merged) pull requests of a repository."""
+
+
+@dataclass(frozen=True)
+class ApiResponse:
+    """Response of an asynchronous API call, whose body has already been read completely.
+
+    Args:
+        - url (str): \
+            Final URL of the request including the query parameters.
+        - status (int): \
+            HTTP status code. Responses served from the ETag cache have the status 200.
+        - headers (Mapping[str, str]): \
+            Response headers.
+        - content (bytes): \
+            Raw response body.
+    """
+
+    url: str
+    status: int
+    headers: Mapping[str, str]
+    content: bytes
+
+    def json(self) -> Any:
+        """Deserialize the response body from JSON.
+        Uses `orjson` for large payloads like issue pages, if it is installed.
+
+        Returns:
+            - Any: Deserialized JSON object.
+        """
+        return _json_loads(self.content)
+
+
+def _duration_days(created_at: Sequence[str], closed_at: Sequence[str]) -> np.ndarray:
+    """Calculate the number of full days between pairs of timestamps of the GitHub API.
+    The timestamps have the fixed format `YYYY-MM-DDTHH:MM:SSZ`, which NumPy parses
+    directly (without the trailing `Z`), so the durations are calculated for all items at once.
+
+    Args:
+        - created_at (Sequence[str]): \
+            Timestamps, when the items were created.
+        - closed_at (Sequence[str]): \
+            Timestamps, when the items were closed.
+
+    Returns:
+        - np.ndarray: Number of full days between both timestamps per item.
+    """
+    created = np.array([timestamp.removesuffix('Z') for timestamp in created_at], dtype='datetime64[s]')
+    closed = np.array([timestamp.removesuffix('Z') for timestamp in closed_at], dtype='datetime64[s]')
+    return (closed - created) // np.timedelta64(1, 'D')
+
+
+def _parse_next(link_attr: str) -> str | None:
+    """Extract the URL of the next page from the `Link` header.
+    GitHub lists the `next` link first, so only the first segment is searched,
+    unless it does not contain the `next` relation.
+
+    Args:
+        - link_attr (str): \
+            Value of the `Link` header.
+
+    Returns:
+        - str | None: \
+            URL of the next page or `None`, if there is no next page.
+    """
+    first_comma = link_attr.find(',')
+    segment = link_attr if first_comma == -1 else link_attr[:first_comma]
+    match = _NEXT_LINK_RE.search(segment if 'rel="next"' in segment else link_attr)
+    return match.group(1) if match else None
+
+
+def _parse_last_page(link_attr: str) -> int | None:
+    """Extract the number of the last page from the `Link` header.
+
+    Args:
+        - link_attr (str): \
+            Value of the `Link` header.
+
+    Returns:
+        - int | None: \
+            Number of the last page or `None`, if the header does not link to the last page.
+    """
+    if 'rel="last"' not in link_attr:
+        return None
+    match = _LAST_PAGE_RE.search(link_attr)
+    return int(match.group(1)) if match else None
 
 
 class GitHubAPIResource(ConfigurableResource):
-    """Custom Dagster resource for the GitHub REST API.
+    """Custom Dagster resource for the GitHub REST and GraphQL API.
 
     Args:
         - github_token (str | None, optional): \
             GitHub token for authentication. If no token is set, the API calls will be without authentication.
         - host (str, optional): \
             Host address of the Contentful Management API. Defaults to 'https://api.github.com'.
+        - max_concurrent_requests (int, optional): \
+            Maximum number of asynchronous requests in flight at the same time. Defaults to 10.
+        - max_concurrent_repositories (int, optional): \
+            Maximum number of repositories, whose metadata is fetched at the same time. Defaults to 10.
+        - etag_cache_path (str | None, optional): \
+            Path of a JSON file for keeping the ETag cache between runs.
+            If not set, responses are cached in memory only.
     """
 
     github_token: str | None = None
@@ -24,16 +217,266 @@ class GitHubAPIResource(ConfigurableResource):
     host: str = 'https://api.github.com'
     """Host of the GitHub REST API."""
 
-    def execute_request(
+    max_concurrent_requests: int = 10
+    """Maximum number of asynchronous requests in flight at the same time, which also limits the connections."""
+
+    max_concurrent_repositories: int = 10
+    """Maximum number of repositories, whose metadata is fetched at the same time by `get_metadata_many`."""
+
+    etag_cache_path: str | None = None
+    """Path of a JSON file for keeping the ETag cache between runs. If not set, responses are cached in memory only."""
+
+    _etag_cache: dict[str, dict[str, Any]] = PrivateAttr(default_factory=dict)
+    """ETag, `Link` header, body and time of last use of the GET responses by request URL,
+    used for conditional requests. The least recently used entry comes first."""
+
+    _etag_cache_size: int = PrivateAttr(default=0)
+    """Total length of the response bodies in the ETag cache."""
+
+    _etag_cache_changed: bool = PrivateAttr(default=False)
+    """Whether an entry of the ETag cache was used or updated by this resource instance."""
+
+    _rate_limit_pause_until: float = PrivateAttr(default=0.0)
+    """Unix timestamp until which no asynchronous requests are sent, because of a rate limit."""
+
+    _request_interval: float = PrivateAttr(default=0.0)
+    """Minimum number of seconds between two asynchronous requests, while the rate limit is running low."""
+
+    _next_request_at: float = PrivateAttr(default=0.0)
+    """Unix timestamp, at which the next asynchronous request may be sent."""
+
+    _request_semaphores: weakref.WeakKeyDictionary = PrivateAttr(default_factory=weakref.WeakKeyDictionary)
+    """Semaphore limiting the requests in flight by event loop, because each `asyncio.run` has its own loop."""
+
+    _metadata_cache: dict[tuple[str, str], dict[str, Any]] = PrivateAttr(default_factory=dict)
+    """Metadata by (owner, repo) of the repositories, which were already fetched by this resource instance."""
+
+    def setup_for_execution(self, context: InitResourceContext) -> None:
+        """Load the ETag cache from the cache file, if one is configured.
+
+        Args:
+            - context (InitResourceContext): \
+                Context for initializing the resource.
+        """
+        entries = self._read_etag_cache_file().items()
+        for key, entry in sorted(entries, key=lambda item: item[1].get('used_at', 0)):
+            self._cache_etag_entry(key, entry)
+
+    def teardown_after_execution(self, context: InitResourceContext) -> None:
+        """Save the ETag cache to the cache file, if one is configured.
+        Entries, which were saved by other runs in the meantime, are kept.
+        Entries not used for `_ETAG_CACHE_MAX_AGE` seconds are dropped and only the most recently
+        used entries up to `_ETAG_CACHE_MAX_SIZE` are saved, so the file does not grow with every run.
+
+        Args:
+            - context (InitResourceContext): \
+                Context for initializing the resource.
+        """
+        if not self.etag_cache_path or not self._etag_cache_changed:
+            return
+
+        # for entries, which were also saved by another run, the most recently used one wins
+        etag_cache = self._read_etag_cache_file()
+        for key, entry in self._etag_cache.items():
+            if entry.get('used_at', 0) >= etag_cache.get(key, {}).get('used_at', 0):
+                etag_cache[key] = entry
+
+        min_used_at = time.time() - _ETAG_CACHE_MAX_AGE
+        entries = [item for item in etag_cache.items() if item[1].get('used_at', 0) > min_used_at]
+        etag_cache = {}
+        size = 0
+        for key, entry in sorted(entries, key=lambda item: item[1]['used_at'], reverse=True):
+            size += len(entry['content'])
+            if size > _ETAG_CACHE_MAX_SIZE:
+                break
+            etag_cache[key] = entry
+
+        path = Path(self.etag_cache_path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # write to a temporary file first, so parallel runs never read a partially written file
+        with tempfile.NamedTemporaryFile('w', dir=path.parent, suffix='.tmp', delete=False) as fp:
+            json.dump(etag_cache, fp)
+        os.replace(fp.name, path)
+
+    def _cache_etag_entry(self, key: str, entry: dict[str, Any]) -> None:
+        """Add or update an entry of the ETag cache as the most recently used one.
+        The least recently used entries are dropped, while the bodies exceed `_ETAG_CACHE_MAX_SIZE`,
+        so the memory used by the cache stays bounded during a run.
+
+        Args:
+            - key (str): \
+                Request URL and query parameters of the cached response.
+            - entry (dict[str, Any]): \
+                ETag, `Link` header, body and time of last use of the response.
+        """
+        previous = self._etag_cache.pop(key, None)
+        if previous:
+            self._etag_cache_size -= len(previous['content'])
+        self._etag_cache[key] = entry
+        self._etag_cache_size += len(entry['content'])
+        while self._etag_cache_size > _ETAG_CACHE_MAX_SIZE:
+            oldest = self._etag_cache.pop(next(iter(self._etag_cache)))
+            self._etag_cache_size -= len(oldest['content'])
+
+    def _read_etag_cache_file(self) -> dict[str, dict[str, Any]]:
+        """Read the ETag cache from the cache file.
+
+        Returns:
+            - dict[str, dict[str, Any]]: \
+                Cached responses or an empty dictionary, if there is no (valid) cache file.
+        """
+        if not self.etag_cache_path:
+            return {}
+        try:
+            with open(self.etag_cache_path, encoding='utf-8') as fp:
+                return json.load(fp)
+        except FileNotFoundError:
+            return {}
+        except json.JSONDecodeError:
+            get_dagster_logger().warning(f'Ignoring invalid ETag cache file {self.etag_cache_path}')
+            return {}
+
+    def _build_request_args(self, params: dict | list[tuple] | None) -> tuple[dict, dict[str, str]]:
+        """Merge the passed query parameters with the defaults and build the request headers.
+
+        Args:
+            - params (dict | list[tuple], optional): \
+                Dictionary or list of tuples to send as query parameters in the request.
+
+        Returns:
+            - tuple[dict, dict[str, str]]: \
+                Query parameters and headers for the request.
+        """
+        if params is None:
+            params = {}
+        default_params = {'apiVersion': '2022-11-28'}
+        # passed parameters win over the default parameters
+        params = {**default_params, **dict(params)}
+
+        headers = {'Accept': 'application/vnd.github+json'}
+        if self.github_token:
+            headers['Authorization'] = f'Bearer {self.github_token}'
+
+        return params, headers
+
+    def _build_url(self, path: str) -> str:
+        """Build the URL for a request without parsing it.
+        URLs from the `Link` header of paginated responses are already absolute and used as they are.
+
+        Args:
+            - path (str): \
+                Path of the endpoint or absolute URL.
+
+        Returns:
+            - str: Absolute URL for the request.
+        """
+        if path.startswith(('https://', 'http://')):
+            return path
+        return f'{self.host.rstrip("/")}/{path.lstrip("/")}'
+
+    def _get_request_semaphore(self) -> asyncio.Semaphore:
+        """Get the semaphore limiting the requests in flight to `max_concurrent_requests` for the running event loop.
+        With HTTP/2, the connection limit of the client does not limit the requests,
+        because all of them are multiplexed over a single connection.
+
+        Returns:
+            - asyncio.Semaphore: Semaphore for the running event loop.
+        """
+        loop = asyncio.get_running_loop()
+        semaphore = self._request_semaphores.get(loop)
+        if semaphore is None:
+            semaphore = self._request_semaphores[loop] = asyncio.Semaphore(self.max_concurrent_requests)
+        return semaphore
+
+    async def _wait_for_rate_limit(self) -> None:
+        """Wait until the current rate limit pause is over and the next request is allowed by the throttle.
+        Each request reserves its own slot, so waiting requests are sent one after another
+        with at least `_request_interval` seconds in between.
+        """
+        now = time.time()
+        start = max(now, self._rate_limit_pause_until, self._next_request_at)
+        self._next_request_at = start + self._request_interval
+        if self._rate_limit_pause_until > now:
+            get_dagster_logger().warning(f'Waiting {start - now:.1f} seconds before sending further requests')
+        if start > now:
+            await asyncio.sleep(start - now)
+
+    def _check_rate_limit(self, status: int, headers: Mapping[str, str], content: bytes, attempt: int) -> bool:
+        """Update the rate limit pause from the response headers and decide, if the request should be retried.
+        Requests are paused until the reset time, when the primary rate limit is used up,
+        and spread evenly until the reset time, when less than the fraction `_RATE_LIMIT_THROTTLE`
+        of the limit is left (e.g. 6 of the 60 requests per hour without authentication).
+        When a secondary rate limit is hit, requests are paused for the time given in `Retry-After`
+        or, without that header, for at least one minute with an exponential backoff.
+        Server errors are retried with an exponential backoff as well.
+        Docs: https://docs.github.com/en/rest/using-the-rest-api/rate-limits-for-the-rest-api
+        https://docs.github.com/en/rest/using-the-rest-api/best-practices-for-using-the-rest-api#handle-rate-limit-errors-appropriately
+
+        Args:
+            - status (int): \
+                HTTP status code of the response.
+            - headers (Mapping[str, str]): \
+                Headers of the response.
+            - content (bytes): \
+                Body of the response, which tells secondary rate limits apart from missing permissions.
+            - attempt (int): \
+                Number of the attempt, starting with 1.
+
+        Returns:
+            - bool: `True`, if the request failed temporarily and should be retried.
+        """
+        limit = headers.get('X-RateLimit-Limit')
+        remaining = headers.get('X-RateLimit-Remaining')
+        reset = headers.get('X-RateLimit-Reset')
+        if remaining is not None and reset:
+            if remaining == '0':
+                self._rate_limit_pause_until = max(self._rate_limit_pause_until, float(reset))
+            # leaky bucket: spread the remaining requests evenly until the reset, when the limit runs low
+            elif limit and int(remaining) < int(limit) * _RATE_LIMIT_THROTTLE:
+                self._request_interval = max(float(reset) - time.time(), 0.0) / int(remaining)
+            else:
+                self._request_interval = 0.0
+
+        if status not in (403, 429) and status < 500:
+            return False
+
+        retry_after = headers.get('Retry-After')
+        if retry_after:
+            delay = float(retry_after)
+        elif remaining == '0':
+            return True  # already paused until the reset
+        elif status == 429 or b'rate limit' in content.lower():
+            # secondary rate limit without `Retry-After`: wait at least one minute, then back off exponentially
+            delay = _SECONDARY_RATE_LIMIT_DELAY * 2 ** (attempt - 1)
+        elif status == 403:
+            return False  # missing permissions instead of a rate limit
+        else:
+            delay = min(60, 2**attempt + random.random())
+
+        self._rate_limit_pause_until = max(self._rate_limit_pause_until, time.time() + delay)
+        return True
+
+    async def execute_request_async(
         self,
+        session: httpx.AsyncClient,
         method: str,
         path: str,
         params: dict | list[tuple] | None = None,
         json: Any | None = None,
-    ) -> requests.Response:
-        """Execute a request to the GitHub REST API.
+    ) -> ApiResponse:
+        """Execute a request to the GitHub REST API without blocking the event loop.
+        The response body is read completely, before the response is returned.
+        GET requests are sent as conditional requests, if the ETag of a previous response is known.
+        When GitHub answers with `304 Not Modified` (which does not count against the rate limit),
+        the cached body is returned instead.
+        At most `max_concurrent_requests` requests are in flight at the same time.
+        Rate limited requests and server errors are retried up to 5 times
+        (see `_check_rate_limit`).
+        Docs: https://docs.github.com/en/rest/using-the-rest-api/best-practices-for-using-the-rest-api#use-conditional-requests-if-appropriate
 
         Args:
+            - session (httpx.AsyncClient): \
+                HTTP client, which multiplexes the requests to the API host over one connection.
             - method (str): \
                 HTTP method for the API call, e.g. 'GET'.
             - path (str): \
@@ -44,47 +487,155 @@ class GitHubAPIResource(ConfigurableResource):
                 A JSON serializable Python object to send in the body of the request.
 
         Returns:
-            - requests.Response: \
-                Response object of the API call.
+            - ApiResponse: \
+                Response of the API call.
 
         Raises:
-            - requests.HTTPError: \
+            - httpx.HTTPStatusError: \
                 When HTTP 4xx or 5xx response is received.
         """
-        if params is None:
-            params = {}
-        default_params = {'apiVersion': '2022-11-28'}
-        # passed parameters win over the default parameters
-        params = {**default_params, **params}
+        logger = get_dagster_logger()
+        url = httpx.URL(self._build_url(path))
+        # httpx replaces the query of the URL with the passed parameters,
+        # so the query of URLs from `Link` headers is merged into the parameters
+        params, headers = self._build_request_args({**url.params, **dict(params or {})})
+        url = str(url.copy_with(query=None))
 
-        headers = {'Accept': 'application/vnd.github+json'}
-        if self.github_token:
-            headers['Authorization'] = f'Bearer {self.github_token}'
+        cache_key = f'{url} {urlencode(sorted(params.items()))}' if method == 'GET' else None
+        cached = self._etag_cache.get(cache_key) if cache_key else None
+        if cached:
+            headers['If-None-Match'] = cached['etag']
 
-        try:
-            response = requests.request(
-                method=method,
-                url=urljoin(self.host, path),
-                params=params,
-                headers=headers,
-                json=json,
+        semaphore = self._get_request_semaphore()
+        for attempt in range(1, _MAX_ATTEMPTS + 1):
+            await self._wait_for_rate_limit()
+            async with semaphore:
+                response = await session.request(
+                    method=method,
+                    url=url,
+                    params=params,
+                    headers=headers,
+                    json=json,
+                )
+            content = response.content
+            logger.info(f'Call {method}: {response.url}')
+
+            if attempt == _MAX_ATTEMPTS or not self._check_rate_limit(
+                response.status_code, response.headers, content, attempt
+            ):
+                break
+            logger.warning(f'Retry {method}: {response.url} after HTTP {response.status_code}')
+
+        if cached and response.status_code == 304:
+            self._cache_etag_entry(cache_key, {**cached, 'used_at': time.time()})
+            self._etag_cache_changed = True
+            cached_headers = {'Link': cached['link']} if cached['link'] else {}
+            return ApiResponse(
+                url=str(response.url), status=200, headers=cached_headers, content=cached['content'].encode()
             )
-            get_dagster_logger().info(f'Call {method}: {response.url}')
 
+        try:
             response.raise_for_status()
+        except httpx.HTTPStatusError as err:
+            logger.exception(f'{err!r} - {content.decode(errors="replace")}')
+            raise
+
+        etag = response.headers.get('ETag')
+        if cache_key and etag and response.status_code == 200:
+            entry = {
+                'etag': etag,
+                'link': response.headers.get('Link'),
+                'content': content.decode(),
+                'used_at': time.time(),
+            }
+            self._cache_etag_entry(cache_key, entry)
+            self._etag_cache_changed = True
+
+        return ApiResponse(
+            url=str(response.url), status=response.status_code, headers=response.headers, content=content
+        )
+
+    async def graphql(
+        self, session: httpx.AsyncClient, query: str, variables: dict[str, Any] | None = None
+    ) -> dict[str, Any]:
+        """Execute a query against the GitHub GraphQL API.
+        The GraphQL API can only be used with authentication.
+        Docs: https://docs.github.com/en/graphql/guides/forming-calls-with-graphql
+
+        Args:
+            - session (httpx.AsyncClient): \
+                HTTP client, which multiplexes the requests to the API host over one connection.
+            - query (str): \
+                GraphQL query document.
+            - variables (dict[str, Any], optional): \
+                Values for the variables used in the query.
+
+        Returns:
+            - dict[str, Any]: \
+                The `data` object of the response.
+
+        Raises:
+            - RuntimeError: \
+                When the response contains errors instead of data.
+        """
+        response = await self.execute_request_async(
+            session=session, method='POST', path='/graphql', json={'query': query, 'variables': variables or {}}
+        )
+        payload = response.json()
+        if payload.get('errors') or not payload.get('data'):
+            raise RuntimeError(f'GraphQL query failed: {payload.get("errors") or payload.get("message")}')
+        return payload['data']
 
-        except requests.exceptions.HTTPError as err:
-            get_dagster_logger().exception(f'{err!r} - {response.text}')
+    def _create_client_session(self) -> httpx.AsyncClient:
+        """Create an HTTP/2 client, whose connection pool is limited to `max_concurrent_requests` connections.
+        With HTTP/2, concurrent requests (e.g. all pages of a repository item) are multiplexed
+        over a single TLS connection instead of opening one connection per request.
+        The connection limit does not limit the requests in flight over HTTP/2,
+        so `execute_request_async` limits them with a semaphore.
 
-        return response
+        Returns:
+            - httpx.AsyncClient: \
+                Client for executing asynchronous requests.
+        """
+        limits = httpx.Limits(
+            max_connections=self.max_concurrent_requests, max_keepalive_connections=self.max_concurrent_requests
+        )
+        return httpx.AsyncClient(http2=True, limits=limits, timeout=30)
 
     def get_metadata(self, owner: str, repo: str) -> dict[str, Any]:
+        """Get consolidated metadata about a GitHub repository.
+        Synchronous wrapper around `get_metadata_async`, so it can be called from Dagster assets.
+
+        Args:
+            - owner (str): \
+                The account owner of the repository.
+                The name is not case sensitive.
+            - repo (str): \
+                The name of the repository without the `.git` extension.
+                The name is not case sensitive.
+
+        Returns:
+            - dict[str, Any]: \
+                The metadata for the repository.
+        """
+        return asyncio.run(self.get_metadata_async(owner=owner, repo=repo))
+
+    async def get_metadata_async(
+        self, owner: str, repo: str, session: httpx.AsyncClient | None = None
+    ) -> dict[str, Any]:
         """Get consolidated metadata about a GitHub repository using
         main endpoint handler, releases handler, and issues handler.
+        The handlers run concurrently and share one connection pool.
         Releases handler and issues handler use a generic method that
-        uses pagination to get all items as a flattened list.
+        uses pagination to get all items page by page.
         Metadata is initialized with the main endpoint handler output and
         extended with the results of the releases and issues handlers.
+        The metadata of each repository is fetched only once per resource instance,
+        repeated calls return a deep copy of the cached metadata.
+        If a GitHub token is set, the counts are taken from a single GraphQL query
+        instead and only the timestamps of the closed issues and PRs are paginated
+        with GraphQL for the durations.
+
         Args:
             - owner (str): \
                 The account owner of the repository.
@@ -92,23 +643,53 @@ class GitHubAPIResource(ConfigurableResource):
             - repo (str): \
                 The name of the repository without the `.git` extension.
                 The name is not case sensitive.
+            - session (httpx.AsyncClient, optional): \
+                HTTP client, which multiplexes the requests to the API host over one connection.
+                If not set, a new client is created for this call.
 
         Returns:
             - dict[str, Any]: \
                 The metadata for the repository.
         """
-        # handle main repo endpoint
-        metadata = self.handle_main_repo_endpoint(owner=owner, repo=repo)
+        # owner and repo are not case sensitive
+        cache_key = (owner.lower(), repo.lower())
+        if cache_key in self._metadata_cache:
+            return copy.deepcopy(self._metadata_cache[cache_key])
+
+        if session is None:
+            async with self._create_client_session() as session:
+                return await self.get_metadata_async(owner=owner, repo=repo, session=session)
+
+        if self.github_token:
+            metadata, totals, average_issue_duration, average_pr_duration = await asyncio.gather(
+                # handle main repo endpoint
+                self.handle_main_repo_endpoint(session=session, owner=owner, repo=repo),
+                # handle counts of releases, issues and PRs
+                self.handle_totals(session=session, owner=owner, repo=repo),
+                # handle closed issues and PRs for the durations
+                self.handle_average_duration(session=session, owner=owner, repo=repo, query=_CLOSED_ISSUES_QUERY),
+                self.handle_average_duration(
+                    session=session, owner=owner, repo=repo, query=_CLOSED_PULL_REQUESTS_QUERY
+                ),
+            )
+            metadata.update(totals)
+            metadata['average_issue_duration'] = average_issue_duration
+            metadata['average_pr_duration'] = average_pr_duration
+            self._metadata_cache[cache_key] = metadata
+            return copy.deepcopy(metadata)
+
+        metadata, release_count, issue_stats = await asyncio.gather(
+            # handle main repo endpoint
+            self.handle_main_repo_endpoint(session=session, owner=owner, repo=repo),
+            # handle releases
+            self.handle_releases(session=session, owner=owner, repo=repo),
+            # handle issues (which contain issues and PRs)
+            self.handle_issues(session=session, owner=owner, repo=repo),
+        )
 
-        # handle releases
-        release_count = self.handle_releases(owner=owner,
-                                             repo=repo)
         metadata['release_count'] = release_count
 
-        # handle issues (which contain issues and PRs)
-        (open_issues, closed_issues, open_prs, closed_prs,
-            average_issue_duration, average_pr_duration) = \
-            self.handle_issues(owner=owner, repo=repo)
+        (open_issues, closed_issues, open_prs, closed_prs, average_issue_duration, average_pr_duration) = issue_stats
         metadata['open_issues'] = open_issues
         metadata['closed_issues'] = closed_issues
         metadata['open_prs'] = open_prs
@@ -116,14 +697,135 @@ class GitHubAPIResource(ConfigurableResource):
         metadata['average_issue_duration'] = average_issue_duration
         metadata['average_pr_duration'] = average_pr_duration
 
-        return metadata
+        self._metadata_cache[cache_key] = metadata
+        return copy.deepcopy(metadata)
+
+    def get_metadata_many(
+        self, repos: Sequence[tuple[str, str]], return_exceptions: bool = False
+    ) -> list[dict[str, Any] | BaseException]:
+        """Get consolidated metadata about multiple GitHub repositories concurrently.
+        Synchronous wrapper around `get_metadata_many_async`, so it can be called from Dagster assets.
+
+        Args:
+            - repos (Sequence[tuple[str, str]]): \
+                Account owner and name of each repository, e.g. `[('delta-io', 'delta-rs')]`.
+            - return_exceptions (bool, optional): \
+                If `True`, the exception of a failed repository is returned in its place
+                instead of being raised, so the metadata of the other repositories is still returned.
+                Defaults to `False`.
+
+        Returns:
+            - list[dict[str, Any] | BaseException]: \
+                The metadata (or exception) for each repository in the same order as `repos`.
+        """
+        return asyncio.run(self.get_metadata_many_async(repos=repos, return_exceptions=return_exceptions))
+
+    async def get_metadata_many_async(
+        self, repos: Sequence[tuple[str, str]], return_exceptions: bool = False
+    ) -> list[dict[str, Any] | BaseException]:
+        """Get consolidated metadata about multiple GitHub repositories concurrently
+        using `get_metadata_async`. All repositories share one connection pool and
+        at most `max_concurrent_repositories` repositories are handled at the same time.
+
+        Args:
+            - repos (Sequence[tuple[str, str]]): \
+                Account owner and name of each repository, e.g. `[('delta-io', 'delta-rs')]`.
+            - return_exceptions (bool, optional): \
+                If `True`, the exception of a failed repository is returned in its place
+                instead of being raised, so the metadata of the other repositories is still returned.
+                Defaults to `False`.
+
+        Returns:
+            - list[dict[str, Any] | BaseException]: \
+                The metadata (or exception) for each repository in the same order as `repos`.
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrent_repositories)
+
+        async def get_metadata(owner: str, repo: str, session: httpx.AsyncClient) -> dict[str, Any]:
+            async with semaphore:
+                return await self.get_metadata_async(owner=owner, repo=repo, session=session)
 
-    def handle_main_repo_endpoint(self, owner: str, repo: str) \
-            -> dict[str, Any]:
+        async with self._create_client_session() as session:
+            return await asyncio.gather(
+                *(get_metadata(owner, repo, session) for owner, repo in repos), return_exceptions=return_exceptions
+            )
+
+    async def handle_totals(self, session: httpx.AsyncClient, owner: str, repo: str) -> dict[str, int]:
+        """Get the count of releases and of open and closed issues and pull requests
+        of a GitHub repository with one GraphQL query, so no pagination is needed.
+        Merged pull requests are counted as closed, like in the REST API.
+        Docs: https://docs.github.com/en/graphql/reference/objects#repository
+
+        Args:
+            - session (httpx.AsyncClient): \
+                HTTP client, which multiplexes the requests to the API host over one connection.
+            - owner (str): \
+                The account owner of the repository.
+                The name is not case sensitive.
+            - repo (str): \
+                The name of the repository without the `.git` extension.
+                The name is not case sensitive.
+
+        Returns:
+            - dict[str, int]: \
+                The counts with the same keys as in the metadata.
+        """
+        data = await self.graphql(session=session, query=_REPO_TOTALS_QUERY, variables={'owner': owner, 'repo': repo})
+        repository = data['repository']
+        return {
+            'release_count': repository['releases']['totalCount'],
+            'open_issues': repository['openIssues']['totalCount'],
+            'closed_issues': repository['closedIssues']['totalCount'],
+            'open_prs': repository['openPullRequests']['totalCount'],
+            'closed_prs': repository['closedPullRequests']['totalCount'],
+        }
+
+    async def handle_average_duration(self, session: httpx.AsyncClient, owner: str, repo: str, query: str) -> float:
+        """Get the average duration in days of closed items (issues or pull requests)
+        of a GitHub repository with GraphQL. Only the two timestamps are requested per item,
+        which makes the pages a lot smaller than the items of the REST API.
+        The pages are requested one after another using the cursor of the previous page.
+        Docs: https://docs.github.com/en/graphql/guides/using-pagination-in-the-graphql-api
+
+        Args:
+            - session (httpx.AsyncClient): \
+                HTTP client, which multiplexes the requests to the API host over one connection.
+            - owner (str): \
+                The account owner of the repository.
+                The name is not case sensitive.
+            - repo (str): \
+                The name of the repository without the `.git` extension.
+                The name is not case sensitive.
+            - query (str): \
+                GraphQL query for one page of closed items, which are selected as `items`.
+
+        Returns:
+            - float: Average duration in days or 0, if there are no closed items.
+        """
+        count = 0
+        duration = 0
+        variables = {'owner': owner, 'repo': repo, 'first': _PER_PAGE, 'after': None}
+        while True:
+            data = await self.graphql(session=session, query=query, variables=variables)
+            items = data['repository']['items']
+            nodes = items['nodes']
+            count += len(nodes)
+            duration += int(
+                _duration_days([node['createdAt'] for node in nodes], [node['closedAt'] for node in nodes]).sum()
+            )
+            if not items['pageInfo']['hasNextPage']:
+                break
+            variables['after'] = items['pageInfo']['endCursor']
+
+        return duration / count if count > 0 else 0.0
+
+    async def handle_main_repo_endpoint(self, session: httpx.AsyncClient, owner: str, repo: str) -> dict[str, Any]:
         """Get metadata about a GitHub repository using the repo endpoint.
         Docs: https://docs.github.com/en/rest/repos/repos?apiVersion=2022-11-28#get-a-repository
 
         Args:
+            - session (httpx.AsyncClient): \
+                HTTP client, which multiplexes the requests to the API host over one connection.
             - owner (str): \
                 The account owner of the repository.
                 The name is not case sensitive.
@@ -136,69 +838,148 @@ class GitHubAPIResource(ConfigurableResource):
                 The standard metadata for the repository.
         """
         path = f'/repos/{owner}/{repo}'
-        response = self.execute_request(method='GET', path=path)
+        response = await self.execute_request_async(session=session, method='GET', path=path)
         payload = response.json()
         return payload
 
-    def handle_repo_item(self, owner: str, repo: str,
-                         suffix: str) \
-            -> list[dict[str, Any]]:
+    async def handle_repo_item(
+        self, session: httpx.AsyncClient, owner: str, repo: str, suffix: str, params: dict | None = None
+    ) -> AsyncIterator[list[dict[str, Any]]]:
         """Get the items (releases, issues, etc.) of a GitHub
-        repository using pagination. A while loop is used to iterate over
-        the pages until the last page is reached. The flattened list of items
-        is returned.
+        repository page by page using pagination. The first page is requested on its own,
+        because its `Link` header contains the number of the last page.
+        All remaining pages are then requested concurrently. If the header
+        only links to the next page, the pages are requested one by one.
+        The maximum page size is requested to keep the number of pages low.
+        Each page is yielded as soon as it has arrived (so not necessarily in order),
+        which allows aggregating the items without keeping all of them in memory.
+        If a page cannot be fetched, the requests for the remaining pages are cancelled
+        and the error is raised, so no results are calculated from incomplete data.
         Docs:
         https://docs.github.com/en/rest/releases/releases?apiVersion=2022-11-28
         https://docs.github.com/en/rest/issues?apiVersion=2022-11-28
+        https://docs.github.com/en/rest/using-the-rest-api/using-pagination-in-the-rest-api
 
         Args:
+            - session (httpx.AsyncClient): \
+                HTTP client, which multiplexes the requests to the API host over one connection.
             - owner (str): \
                 The account owner of the repository.
                 The name is not case sensitive.
             - repo (str): \
                 The name of the repository without the `.git` extension.
                 The name is not case sensitive.
+            - suffix (str): \
+                Path of the item endpoint relative to the repository, e.g. 'releases'.
+            - params (dict, optional): \
+                Additional query parameters for the endpoint, e.g. `{'state': 'all'}`.
 
-        Returns:
+        Yields:
             - list[dict[str, Any]]: \
-                Flattened list of items from all pages.
-        """
+                Items of one page.
 
-        # initialize variables
+        Raises:
+            - httpx.HTTPStatusError: \
+                When HTTP 4xx or 5xx response is received for one of the pages.
+        """
         path = f'/repos/{owner}/{repo}/{suffix}'
-        nested_list = []
-        while True:
-            # execute request
-            response = self.execute_request(method='GET', path=path)
-            items = response.json()
+        params = {'per_page': _PER_PAGE, **(params or {})}
 
-            if not items:
-                break
-            nested_list.append(items)
+        async def fetch_page(page: int) -> list[dict[str, Any]]:
+            response = await self.execute_request_async(
+                session=session, method='GET', path=path, params={**params, 'page': page}
+            )
+            return response.json()
 
-            # check if there is a next page
-            link_attr = response.headers.get('Link')
-            if not link_attr:
-                break
+        # the first page tells how many pages there are
+        response = await self.execute_request_async(session=session, method='GET', path=path, params=params)
+        items = response.json()
+        if not items:
+            return
 
-            # extract the next page URL
-            match = re.search(r'<(.*?)>; rel="next"', link_attr)
-            if not match:
-                break
+        link_attr = response.headers.get('Link', '')
+        last_page = _parse_last_page(link_attr)
+        if last_page:
+            # start requesting the remaining pages, before the first page is processed
+            tasks = [asyncio.ensure_future(fetch_page(page)) for page in range(2, last_page + 1)]
+            try:
+                yield items
+                for next_page in asyncio.as_completed(tasks):
+                    yield await next_page
+            finally:
+                for task in tasks:
+                    task.cancel()
+        else:
+            yield items
+            # without a link to the last page, the next pages need to be followed one by one
+            # (the next URL already contains the query parameters of the first request)
+            next_url = _parse_next(link_attr)
+            while next_url:
+                response = await self.execute_request_async(session=session, method='GET', path=next_url)
+                items = response.json()
+                if not items:
+                    break
+                yield items
+                next_url = _parse_next(response.headers.get('Link', ''))
 
-            path = match.group(1)  # update path for next iteration
+    async def count_repo_items(
+        self, session: httpx.AsyncClient, owner: str, repo: str, suffix: str, params: dict | None = None
+    ) -> int:
+        """Get the count of the items (releases, issues, etc.) of a GitHub repository
+        without requesting all pages. The `Link` header of the first page contains
+        the number of the last page, so only the last page needs to be requested additionally:
+        All other pages contain the maximum number of items per page.
+        If the header does not link to the last page, the next pages are followed one by one.
+        Docs: https://docs.github.com/en/rest/using-the-rest-api/using-pagination-in-the-rest-api
 
-        flattened_list = [item for sublist in nested_list for item in sublist]
-        return flattened_list
+        Args:
+            - session (httpx.AsyncClient): \
+                HTTP client, which multiplexes the requests to the API host over one connection.
+            - owner (str): \
+                The account owner of the repository.
+                The name is not case sensitive.
+            - repo (str): \
+                The name of the repository without the `.git` extension.
+                The name is not case sensitive.
+            - suffix (str): \
+                Path of the item endpoint relative to the repository, e.g. 'releases'.
+            - params (dict, optional): \
+                Additional query parameters for the endpoint, e.g. `{'state': 'all'}`.
 
-    def handle_releases(self, owner: str, repo: str) -> int:
+        Returns:
+            - int: Number of items counted.
+        """
+        path = f'/repos/{owner}/{repo}/{suffix}'
+        params = {'per_page': _PER_PAGE, **(params or {})}
+
+        response = await self.execute_request_async(session=session, method='GET', path=path, params=params)
+        link_attr = response.headers.get('Link', '')
+        last_page = _parse_last_page(link_attr)
+        if last_page:
+            response = await self.execute_request_async(
+                session=session, method='GET', path=path, params={**params, 'page': last_page}
+            )
+            return (last_page - 1) * int(params['per_page']) + len(response.json())
+
+        # without a link to the last page, the next pages need to be followed one by one
+        # (the first page is not requested again)
+        count = len(response.json())
+        next_url = _parse_next(link_attr)
+        while next_url:
+            response = await self.execute_request_async(session=session, method='GET', path=next_url)
+            count += len(response.json())
+            next_url = _parse_next(response.headers.get('Link', ''))
+        return count
+
+    async def handle_releases(self, session: httpx.AsyncClient, owner: str, repo: str) -> int:
         """Get the count of releases of a GitHub repository
-        using the generic method `handle_repo_item`.
-        Length of the list of releases is returned.
+        using the generic method `count_repo_items`.
         Docs:
         https://docs.github.com/en/rest/repos/releases?apiVersion=2022-11-28
 
         Args:
+            - session (httpx.AsyncClient): \
+                HTTP client, which multiplexes the requests to the API host over one connection.
             - owner (str): \
                 The account owner of the repository.
                 The name is not case sensitive.
@@ -209,25 +990,38 @@ class GitHubAPIResource(ConfigurableResource):
             - int: Number of releases counted.
 
         """
-        releases = self.handle_repo_item(owner=owner, repo=repo,
-                                         suffix='releases')
-        return len(releases)
+        return await self.count_repo_items(session=session, owner=owner, repo=repo, suffix='releases')
 
-    def handle_issues(self, owner: str, repo: str) \
-            -> Tuple[int, int, int, int, float, float]:
+    async def handle_issues(
+        self, session: httpx.AsyncClient, owner: str, repo: str
+    ) -> Tuple[int, int, int, int, float, float]:
         """Get the count of open and closed issues and pull requests
         and the average duration for closed issues and pull requests of
         a GitHub repository using the generic method `handle_repo_item`.
-        Afterward, the method iterates over all issues
-        and calculates counts and durations.
+        The counts and timestamps are collected for each page in a single pass,
+        as soon as it arrives, and the durations are calculated with NumPy.
         'state=all' needs to be used to get all issues,
         otherwise only open issues are returned.
         Docs:
         https://docs.github.com/en/rest/issues?apiVersion=2022-11-28
+
+        Args:
+            - session (httpx.AsyncClient): \
+                HTTP client, which multiplexes the requests to the API host over one connection.
+            - owner (str): \
+                The account owner of the repository.
+                The name is not case sensitive.
+            - repo (str): \
+                The name of the repository without the `.git` extension.
+                The name is not case sensitive.
+
+        Returns:
+            - tuple[int, int, int, int, float, float]: \
+                Open issues, closed issues, open PRs, closed PRs,
+                average issue duration and average PR duration in days.
         """
         # get all issues
-        issues = self.handle_repo_item(owner=owner, repo=repo,
-                                       suffix='issues?state=all')
+        pages = self.handle_repo_item(session=session, owner=owner, repo=repo, suffix='issues', params={'state': 'all'})
         # initialize variables
         open_issues = 0
         closed_issues = 0
@@ -236,28 +1030,33 @@ class GitHubAPIResource(ConfigurableResource):
         issues_duration = 0
         prs_duration = 0
 
-        # iterate over issues
-        for issue in issues:
-            if issue['state'] == 'open':  # open issue / pr
-                if 'pull_request' in issue.keys():  # open pull request
-                    open_prs += 1
-                else:  # open issue
-                    open_issues += 1
-            elif issue['state'] == 'closed':  # closed issue / pr
-                if 'pull_request' in issue.keys():  # closed pull request
-                    closed_prs += 1
-                    created_at = datetime.strptime(issue['created_at'], '%Y-%m-%dT%H:%M:%SZ')
-                    closed_at = datetime.strptime(issue['closed_at'], '%Y-%m-%dT%H:%M:%SZ')
-                    prs_duration += (closed_at - created_at).days
-                else:  # closed issue
-                    closed_issues += 1
-                    created_at = datetime.strptime(issue['created_at'], '%Y-%m-%dT%H:%M:%SZ')
-                    closed_at = datetime.strptime(issue['closed_at'], '%Y-%m-%dT%H:%M:%SZ')
-                    issues_duration += (closed_at - created_at).days
-
-        average_pr_duration = \
-            prs_duration / closed_prs if closed_prs > 0 else 0
-        average_issue_duration = \
-            issues_duration / closed_issues if closed_issues > 0 else 0
-        return (open_issues, closed_issues, open_prs, closed_prs,
-                average_issue_duration, average_pr_duration)
+        # aggregate issues page by page
+        async for issues in pages:
+            # count open items and collect the timestamps of closed items in a single pass
+            closed_is_pr = []
+            created_at = []
+            closed_at = []
+            for issue in issues:
+                issue_state = issue['state']
+                is_pr = 'pull_request' in issue
+                if issue_state == 'closed':  # closed issue / pr
+                    closed_is_pr.append(is_pr)
+                    created_at.append(issue['created_at'])
+                    closed_at.append(issue['closed_at'])
+                elif issue_state == 'open':  # open issue / pr
+                    if is_pr:
+                        open_prs += 1
+                    else:
+                        open_issues += 1
+
+            is_pr = np.array(closed_is_pr, dtype=bool)
+            durations = _duration_days(created_at, closed_at)
+            page_closed_prs = int(np.count_nonzero(is_pr))
+            closed_prs += page_closed_prs
+            closed_issues += len(is_pr) - page_closed_prs
+            prs_duration += int(durations[is_pr].sum())
+            issues_duration += int(durations[~is_pr].sum())
+
+        average_pr_duration = prs_duration / closed_prs if closed_prs > 0 else 0.0
+        average_issue_duration = issues_duration / closed_issues if closed_issues > 0 else 0.0
+        return (open_issues, closed_issues, open_prs, closed_prs, average_issue_duration, average_pr_duration)
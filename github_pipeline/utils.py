@@ -1,11 +1,29 @@
 from typing import Any
 
-import pandas as pd
 from dagster import AssetExecutionContext, MetadataValue
 
 
+def _format_cell(value: Any) -> str:
+    """Format a value of the report data as a cell of the markdown table.
+
+    Args:
+        - value (Any): \
+            Value of the report data.
+
+    Returns:
+        - str: \
+            Formatted value, where floats are rounded to one decimal place and missing values are empty.
+    """
+    if value is None:
+        return ''
+    if isinstance(value, float):
+        return f'{value:.1f}'
+    return str(value)
+
+
 def create_markdown_report(context: AssetExecutionContext, report_data: dict[str, dict]) -> str:
     """Create a markdown report from the report data.
+    Each entry of the report data becomes a column and the fields become the rows of the table.
 
     Args:
         - context (AssetExecutionContext): \
@@ -17,9 +35,23 @@ def create_markdown_report(context: AssetExecutionContext, report_data: dict[str
         - str: \
             Markdown formatted report.
     """
-    # use pandas to convert dict with report data to markdown table
-    df_report = pd.DataFrame.from_dict(report_data)
-    md_report = df_report.to_markdown()
+    # convert dict with report data to markdown table (first column with the field names)
+    columns = list(report_data)
+    fields = list(dict.fromkeys(field for column_data in report_data.values() for field in column_data))
+    header = ['', *columns]
+    rows = [[field, *(_format_cell(report_data[column].get(field)) for column in columns)] for field in fields]
+    widths = [max(len(cell) for cell in column_cells) for column_cells in zip(header, *rows)]
+
+    # field names are aligned left, values are aligned right
+    separator = ['-' * (widths[0] + 2), *('-' * (width + 1) + ':' for width in widths[1:])]
+    lines = [
+        '| ' + ' | '.join(cell.ljust(width) for cell, width in zip(header, widths)) + ' |',
+        '|' + '|'.join(separator) + '|',
+    ]
+    for field, *values in rows:
+        cells = [field.ljust(widths[0]), *(value.rjust(width) for value, width in zip(values, widths[1:]))]
+        lines.append('| ' + ' | '.join(cells) + ' |')
+    md_report = '\n'.join(lines)
 
     context.add_output_metadata(
         metadata={
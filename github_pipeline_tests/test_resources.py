@@ -0,0 +1,533 @@
+import asyncio
+import json
+import time
+from collections.abc import Awaitable, Callable
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any
+
+import httpx
+import pytest
+
+from dagster import build_init_resource_context
+from github_pipeline import resources
+from github_pipeline.resources import GitHubAPIResource
+
+
+@pytest.fixture
+def sleeps(monkeypatch: pytest.MonkeyPatch) -> list[float]:
+    """Record the delays of the rate limit pauses instead of waiting."""
+    delays = []
+
+    async def sleep(delay: float) -> None:
+        delays.append(delay)
+
+    monkeypatch.setattr(resources.asyncio, 'sleep', sleep)
+    return delays
+
+
+def execute(resource: GitHubAPIResource, responses: list[httpx.Response], path: str = '/repos/o/r') -> list:
+    """Execute the request with a mocked transport, which answers with the given responses in order.
+
+    Returns:
+        - list: The API response (or the raised exception) and the sent requests.
+    """
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return responses[len(requests) - 1]
+
+    async def run() -> resources.ApiResponse:
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as session:
+            return await resource.execute_request_async(session=session, method='GET', path=path)
+
+    try:
+        return [asyncio.run(run()), requests]
+    except httpx.HTTPStatusError as err:
+        return [err, requests]
+
+
+def test_retry_after_is_respected(sleeps: list[float]) -> None:
+    resource = GitHubAPIResource()
+    responses = [httpx.Response(403, headers={'Retry-After': '7'}), httpx.Response(200, json={'id': 1})]
+
+    response, requests = execute(resource, responses)
+
+    assert response.json() == {'id': 1}
+    assert len(requests) == 2
+    assert sleeps and 6 < sleeps[0] <= 7
+
+
+def test_primary_rate_limit_pauses_until_reset(sleeps: list[float]) -> None:
+    resource = GitHubAPIResource()
+    reset = str(int(time.time()) + 30)
+    responses = [
+        httpx.Response(403, headers={'X-RateLimit-Remaining': '0', 'X-RateLimit-Reset': reset}),
+        httpx.Response(200, json={'id': 1}),
+    ]
+
+    response, requests = execute(resource, responses)
+
+    assert response.status == 200
+    assert len(requests) == 2
+    assert sleeps and 28 < sleeps[0] <= 30
+
+
+def test_secondary_rate_limit_without_retry_after_waits_a_minute(sleeps: list[float]) -> None:
+    resource = GitHubAPIResource()
+    headers = {'X-RateLimit-Remaining': '4000', 'X-RateLimit-Reset': str(int(time.time()) + 3600)}
+    message = {'message': 'You have exceeded a secondary rate limit. Please wait a few minutes before you try again.'}
+    responses = [
+        httpx.Response(403, headers=headers, json=message),
+        httpx.Response(403, headers=headers, json=message),
+        httpx.Response(200, headers=headers, json={'id': 1}),
+    ]
+
+    response, requests = execute(resource, responses)
+
+    assert response.status == 200
+    assert len(requests) == 3
+    assert len(sleeps) == 2
+    assert 59 < sleeps[0] <= 60
+    assert 119 < sleeps[1] <= 120
+
+
+def test_forbidden_without_rate_limit_is_not_retried(sleeps: list[float]) -> None:
+    resource = GitHubAPIResource()
+    headers = {'X-RateLimit-Remaining': '4000', 'X-RateLimit-Reset': str(int(time.time()) + 3600)}
+    responses = [httpx.Response(403, headers=headers, json={'message': 'Resource not accessible by integration'})]
+
+    error, requests = execute(resource, responses)
+
+    assert isinstance(error, httpx.HTTPStatusError)
+    assert error.response.status_code == 403
+    assert len(requests) == 1
+    assert not sleeps
+
+
+def test_server_errors_are_retried_with_exponential_backoff(sleeps: list[float]) -> None:
+    resource = GitHubAPIResource()
+    responses = [httpx.Response(502), httpx.Response(503), httpx.Response(200, json={'id': 1})]
+
+    response, requests = execute(resource, responses)
+
+    assert response.json() == {'id': 1}
+    assert len(requests) == 3
+    assert len(sleeps) == 2
+    assert 1.9 < sleeps[0] <= 3
+    assert 3.9 < sleeps[1] <= 5
+
+
+def test_server_errors_are_raised_after_the_last_attempt(sleeps: list[float]) -> None:
+    resource = GitHubAPIResource()
+    responses = [httpx.Response(502)] * resources._MAX_ATTEMPTS
+
+    error, requests = execute(resource, responses)
+
+    assert isinstance(error, httpx.HTTPStatusError)
+    assert len(requests) == resources._MAX_ATTEMPTS
+
+
+def test_low_rate_limit_spreads_requests_until_reset(sleeps: list[float]) -> None:
+    resource = GitHubAPIResource()
+    headers = {
+        'X-RateLimit-Limit': '5000',
+        'X-RateLimit-Remaining': '10',
+        'X-RateLimit-Reset': str(int(time.time()) + 100),
+    }
+    response = httpx.Response(200, headers=headers, json={})
+
+    for _ in range(4):
+        execute(resource, [response])
+
+    # the throttle starts after the first response, then each request gets a slot 10 seconds after the previous one
+    # (the sleeps are not waited for, so the delays add up)
+    assert len(sleeps) == 2
+    assert 9 < sleeps[0] <= 10
+    assert 19 < sleeps[1] <= 20
+
+
+def test_unauthenticated_rate_limit_is_not_throttled_while_enough_requests_remain(sleeps: list[float]) -> None:
+    resource = GitHubAPIResource()
+    reset = int(time.time()) + 3600
+
+    for remaining in range(59, 49, -1):
+        headers = {'X-RateLimit-Limit': '60', 'X-RateLimit-Remaining': str(remaining), 'X-RateLimit-Reset': str(reset)}
+        execute(resource, [httpx.Response(200, headers=headers, json={})])
+
+    assert not sleeps
+
+
+def test_not_modified_returns_cached_response(sleeps: list[float]) -> None:
+    resource = GitHubAPIResource()
+    link = '<https://api.github.com/repos/o/r/issues?page=2>; rel="next"'
+    first, _ = execute(resource, [httpx.Response(200, headers={'ETag': '"abc"', 'Link': link}, json=[{'id': 1}])])
+
+    response, requests = execute(resource, [httpx.Response(304, headers={'ETag': '"abc"'})])
+
+    assert requests[0].headers['If-None-Match'] == '"abc"'
+    assert response.status == 200
+    assert response.json() == first.json() == [{'id': 1}]
+    assert response.headers['Link'] == link
+
+
+def test_etag_cache_file_keeps_entries_of_other_runs(tmp_path: Path) -> None:
+    path = tmp_path / 'etag_cache.json'
+    now = time.time()
+    other = {'etag': '"other"', 'link': None, 'content': '[]', 'used_at': now - 60}
+    expired = {'etag': '"old"', 'link': None, 'content': '[]', 'used_at': now - resources._ETAG_CACHE_MAX_AGE - 60}
+    path.write_text(json.dumps({'other-repository': other, 'expired': expired}))
+    resource = GitHubAPIResource(etag_cache_path=str(path))
+    context = build_init_resource_context()
+
+    resource.setup_for_execution(context)
+    execute(resource, [httpx.Response(200, headers={'ETag': '"abc"'}, json=[{'id': 1}])])
+    resource.teardown_after_execution(context)
+
+    etag_cache = json.loads(path.read_text())
+    assert etag_cache['other-repository'] == other
+    assert 'expired' not in etag_cache
+    assert [entry['etag'] for entry in etag_cache.values()] == ['"abc"', '"other"']
+
+
+def test_etag_cache_drops_least_recently_used_entries(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(resources, '_ETAG_CACHE_MAX_SIZE', 25)
+    resource = GitHubAPIResource()
+
+    for page in range(1, 4):
+        response = httpx.Response(200, headers={'ETag': f'"{page}"'}, json=[{'id': page}])
+        execute(resource, [response], path=f'/repos/o/r/issues?page={page}')
+
+    # each body has 10 characters, so only the last two pages fit
+    assert [entry['etag'] for entry in resource._etag_cache.values()] == ['"2"', '"3"']
+    assert resource._etag_cache_size == 20
+
+
+def count(resource: GitHubAPIResource, pages: int, per_page: int, last_link: bool) -> tuple[int, list[int]]:
+    """Count the releases of a mocked repository with the given number of pages, the last page holding one item.
+
+    Returns:
+        - tuple[int, list[int]]: The counted items and the requested page numbers.
+    """
+    requested = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        page = int(request.url.params.get('page', 1))
+        requested.append(page)
+        links = []
+        if page < pages:
+            links.append(f'<{request.url.copy_set_param("page", page + 1)}>; rel="next"')
+            if last_link:
+                links.append(f'<{request.url.copy_set_param("page", pages)}>; rel="last"')
+        items = [{'id': i} for i in range(per_page if page < pages else 1)]
+        return httpx.Response(200, headers={'Link': ', '.join(links)}, json=items)
+
+    async def run() -> int:
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as session:
+            return await resource.count_repo_items(
+                session=session, owner='o', repo='r', suffix='releases', params={'per_page': per_page}
+            )
+
+    return asyncio.run(run()), requested
+
+
+def test_count_repo_items_uses_last_page_link() -> None:
+    counted, requested = count(GitHubAPIResource(), pages=4, per_page=30, last_link=True)
+
+    assert counted == 3 * 30 + 1
+    assert requested == [1, 4]
+
+
+def test_count_repo_items_follows_next_links_without_last_page_link() -> None:
+    counted, requested = count(GitHubAPIResource(), pages=4, per_page=30, last_link=False)
+
+    assert counted == 3 * 30 + 1
+    assert requested == [1, 2, 3, 4]
+
+
+def test_requests_in_flight_are_limited() -> None:
+    resource = GitHubAPIResource(max_concurrent_requests=3)
+    in_flight = 0
+    max_in_flight = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return httpx.Response(200, json={})
+
+    async def run() -> None:
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as session:
+            await asyncio.gather(
+                *(
+                    resource.execute_request_async(session=session, method='GET', path=f'/repos/o/r/issues?page={page}')
+                    for page in range(1, 21)
+                )
+            )
+
+    # each call of asyncio.run gets its own semaphore
+    for _ in range(2):
+        asyncio.run(run())
+
+    assert max_in_flight == 3
+
+
+def test_get_metadata_is_fetched_once_and_returns_copies(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls = []
+
+    async def handle_main_repo_endpoint(self, session: httpx.AsyncClient, owner: str, repo: str) -> dict:
+        calls.append((owner, repo))
+        return {'owner': {'login': owner}}
+
+    async def handle_releases(self, session: httpx.AsyncClient, owner: str, repo: str) -> int:
+        return 1
+
+    async def handle_issues(self, session: httpx.AsyncClient, owner: str, repo: str) -> tuple:
+        return (1, 2, 3, 4, 5.0, 6.0)
+
+    for handler in (handle_main_repo_endpoint, handle_releases, handle_issues):
+        monkeypatch.setattr(GitHubAPIResource, handler.__name__, handler)
+    resource = GitHubAPIResource()
+
+    metadata = resource.get_metadata(owner='o', repo='r')
+    metadata['owner']['login'] = 'changed'
+
+    assert resource.get_metadata(owner='O', repo='R')['owner'] == {'login': 'o'}
+    assert resource.get_metadata_many([('o', 'r')])[0]['release_count'] == 1
+    assert calls == [('o', 'r')]
+    # a new resource instance starts with an empty cache
+    GitHubAPIResource().get_metadata(owner='o', repo='r')
+    assert len(calls) == 2
+
+
+def test_get_metadata_many_returns_exceptions_of_failed_repositories(monkeypatch: pytest.MonkeyPatch) -> None:
+    error = RuntimeError('not found')
+
+    async def get_metadata_async(self, owner: str, repo: str, session: httpx.AsyncClient | None = None) -> dict:
+        if repo == 'missing':
+            raise error
+        return {'name': repo}
+
+    monkeypatch.setattr(GitHubAPIResource, 'get_metadata_async', get_metadata_async)
+    resource = GitHubAPIResource()
+    repos = [('o', 'r'), ('o', 'missing'), ('o', 's')]
+
+    assert resource.get_metadata_many(repos, return_exceptions=True) == [{'name': 'r'}, error, {'name': 's'}]
+    with pytest.raises(RuntimeError):
+        resource.get_metadata_many(repos)
+
+
+def call(resource: GitHubAPIResource, handler: Callable[[httpx.Request], httpx.Response], method: str, **kwargs) -> Any:
+    """Call an asynchronous method of the resource with a mocked transport, which answers with the handler.
+
+    Returns:
+        - Any: The result of the method.
+    """
+
+    async def run() -> Any:
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as session:
+            return await getattr(resource, method)(session=session, **kwargs)
+
+    return asyncio.run(run())
+
+
+def test_handle_totals_counts_with_one_graphql_query() -> None:
+    resource = GitHubAPIResource(github_token='token')
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        repository = {
+            'releases': {'totalCount': 1},
+            'openIssues': {'totalCount': 2},
+            'closedIssues': {'totalCount': 3},
+            'openPullRequests': {'totalCount': 4},
+            'closedPullRequests': {'totalCount': 5},
+        }
+        return httpx.Response(200, json={'data': {'repository': repository}})
+
+    totals = call(resource, handler, 'handle_totals', owner='o', repo='r')
+
+    assert totals == {'release_count': 1, 'open_issues': 2, 'closed_issues': 3, 'open_prs': 4, 'closed_prs': 5}
+    assert len(requests) == 1
+    assert requests[0].method == 'POST'
+    assert requests[0].url.path == '/graphql'
+    assert requests[0].headers['Authorization'] == 'Bearer token'
+    payload = json.loads(requests[0].content)
+    assert payload['variables'] == {'owner': 'o', 'repo': 'r'}
+    # merged pull requests are counted as closed, like in the REST API
+    assert 'pullRequests(states: [CLOSED, MERGED])' in payload['query']
+
+
+def test_graphql_raises_on_errors() -> None:
+    resource = GitHubAPIResource(github_token='token')
+    errors = [{'type': 'NOT_FOUND', 'message': "Could not resolve to a Repository with the name 'o/r'."}]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={'data': {'repository': None}, 'errors': errors})
+
+    with pytest.raises(RuntimeError, match='Could not resolve'):
+        call(resource, handler, 'handle_totals', owner='o', repo='r')
+
+
+def test_handle_average_duration_follows_the_cursor() -> None:
+    resource = GitHubAPIResource(github_token='token')
+    # each item was closed after some days and 23 hours, which only count as full days
+    created_at = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    days = [i % 40 for i in range(250)]
+    nodes = [
+        {
+            'createdAt': created_at.strftime('%Y-%m-%dT%H:%M:%SZ'),
+            'closedAt': (created_at + timedelta(days=day, hours=23)).strftime('%Y-%m-%dT%H:%M:%SZ'),
+        }
+        for day in days
+    ]
+    variables = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        payload = json.loads(request.content)
+        variables.append(payload['variables'])
+        start = int(payload['variables']['after'] or 0)
+        end = start + payload['variables']['first']
+        items = {
+            'nodes': nodes[start:end],
+            'pageInfo': {'endCursor': str(min(end, len(nodes))), 'hasNextPage': end < len(nodes)},
+        }
+        return httpx.Response(200, json={'data': {'repository': {'items': items}}})
+
+    average = call(
+        resource, handler, 'handle_average_duration', owner='o', repo='r', query=resources._CLOSED_ISSUES_QUERY
+    )
+
+    assert average == pytest.approx(sum(days) / len(days))
+    assert [item['after'] for item in variables] == [None, '100', '200']
+    assert all(item['first'] == resources._PER_PAGE for item in variables)
+
+
+def test_handle_average_duration_without_closed_items() -> None:
+    resource = GitHubAPIResource(github_token='token')
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        items = {'nodes': [], 'pageInfo': {'endCursor': None, 'hasNextPage': False}}
+        return httpx.Response(200, json={'data': {'repository': {'items': items}}})
+
+    average = call(
+        resource, handler, 'handle_average_duration', owner='o', repo='r', query=resources._CLOSED_PULL_REQUESTS_QUERY
+    )
+
+    assert average == 0.0
+    assert isinstance(average, float)
+
+
+def paginate(items: list[dict], last_link: bool = True) -> Callable[[httpx.Request], Awaitable[httpx.Response]]:
+    """Create a handler, which serves the items page by page like the REST API and tracks the requests.
+
+    Returns:
+        - Callable[[httpx.Request], Awaitable[httpx.Response]]: \
+            Handler with the attributes `requested` (page numbers) and `max_in_flight`.
+    """
+    in_flight = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight
+        per_page = int(request.url.params['per_page'])
+        page = int(request.url.params.get('page', 1))
+        pages = max(1, -(-len(items) // per_page))
+        handler.requested.append(page)
+        in_flight += 1
+        handler.max_in_flight = max(handler.max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+
+        links = []
+        if page < pages:
+            links.append(f'<{request.url.copy_set_param("page", page + 1)}>; rel="next"')
+            if last_link:
+                links.append(f'<{request.url.copy_set_param("page", pages)}>; rel="last"')
+        page_items = items[(page - 1) * per_page : page * per_page]
+        return httpx.Response(200, headers={'Link': ', '.join(links)}, json=page_items)
+
+    handler.requested = []
+    handler.max_in_flight = 0
+    return handler
+
+
+def collect_pages(resource: GitHubAPIResource, handler: Callable, suffix: str = 'releases') -> list[list[dict]]:
+    """Collect the pages yielded by `handle_repo_item` with a mocked transport.
+
+    Returns:
+        - list[list[dict]]: The items of each page in the order, in which the pages were yielded.
+    """
+
+    async def run() -> list[list[dict]]:
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as session:
+            pages = resource.handle_repo_item(session=session, owner='o', repo='r', suffix=suffix)
+            return [page async for page in pages]
+
+    return asyncio.run(run())
+
+
+def test_handle_repo_item_requests_remaining_pages_concurrently() -> None:
+    items = [{'id': i} for i in range(450)]
+    handler = paginate(items)
+
+    pages = collect_pages(GitHubAPIResource(), handler)
+
+    assert sorted(item['id'] for page in pages for item in page) == list(range(450))
+    assert handler.requested[0] == 1
+    assert sorted(handler.requested) == [1, 2, 3, 4, 5]
+    # the first page tells the number of pages, then pages 2 to 5 are requested at the same time
+    assert handler.max_in_flight == 4
+
+
+def test_handle_repo_item_follows_next_links_without_last_page_link() -> None:
+    items = [{'id': i} for i in range(250)]
+    handler = paginate(items, last_link=False)
+
+    pages = collect_pages(GitHubAPIResource(), handler)
+
+    assert [len(page) for page in pages] == [100, 100, 50]
+    assert handler.requested == [1, 2, 3]
+    assert handler.max_in_flight == 1
+
+
+def test_handle_repo_item_raises_for_a_failed_page() -> None:
+    handler = paginate([{'id': i} for i in range(450)])
+
+    async def failing_handler(request: httpx.Request) -> httpx.Response:
+        if request.url.params.get('page') == '3':
+            return httpx.Response(404, json={'message': 'Not Found'})
+        return await handler(request)
+
+    with pytest.raises(httpx.HTTPStatusError):
+        collect_pages(GitHubAPIResource(), failing_handler)
+
+
+def test_handle_issues_aggregates_issues_and_pull_requests() -> None:
+    created_at = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+    def issue(number: int, state: str, is_pr: bool, days: int = 0) -> dict:
+        closed_at = created_at + timedelta(days=days, hours=12)
+        item = {
+            'number': number,
+            'state': state,
+            'created_at': created_at.strftime('%Y-%m-%dT%H:%M:%SZ'),
+            'closed_at': closed_at.strftime('%Y-%m-%dT%H:%M:%SZ') if state == 'closed' else None,
+        }
+        if is_pr:
+            item['pull_request'] = {'url': f'https://api.github.com/repos/o/r/pulls/{number}'}
+        return item
+
+    # 120 open issues, 60 open PRs, closed issues after 1 to 3 days, closed PRs after 4 to 6 days
+    issues = [issue(i, 'open', is_pr=i % 3 == 0) for i in range(180)]
+    issues += [issue(180 + i, 'closed', is_pr=False, days=1 + i % 3) for i in range(90)]
+    issues += [issue(270 + i, 'closed', is_pr=True, days=4 + i % 3) for i in range(45)]
+    handler = paginate(issues)
+
+    stats = call(GitHubAPIResource(), handler, 'handle_issues', owner='o', repo='r')
+
+    assert stats == (120, 90, 60, 45, 2.0, 5.0)
+    assert sorted(handler.requested) == [1, 2, 3, 4]
@@ -0,0 +1,22 @@
+from unittest.mock import MagicMock
+
+from github_pipeline.utils import create_markdown_report
+
+
+def test_create_markdown_report() -> None:
+    context = MagicMock()
+    report_data = {
+        'delta-rs': {'stars': 2100, 'avg days until issue was closed': 45.0, 'avg days until PR was closed': None},
+        'hudi-rs': {'stars': 150, 'avg days until issue was closed': 0.0, 'avg days until PR was closed': 122.123},
+    }
+
+    md_report = create_markdown_report(context, report_data)
+
+    assert md_report == (
+        '|                                 | delta-rs | hudi-rs |\n'
+        '|---------------------------------|---------:|--------:|\n'
+        '| stars                           |     2100 |     150 |\n'
+        '| avg days until issue was closed |     45.0 |     0.0 |\n'
+        '| avg days until PR was closed    |          |   122.1 |'
+    )
+    context.add_output_metadata.assert_called_once()